@@ -4,11 +4,10 @@ import numpy as np
 from datetime import datetime, timedelta
 import warnings
 
-warnings.filterwarnings('ignore')
-
+from config import CACHE_SIZE, CACHE_TTL, DOWNSAMPLE_THRESHOLD
 from data_handler import StockDataHandler, FeatureEngineer, ComparativeAnalysis
 from visualizations import FinancialCharts, ComparativeCharts
-from glossary import display_term_with_help, add_glossary_section, GLOSSARY
+from glossary import display_term_with_help, add_glossary_section, get_term_tooltip
 
 st.set_page_config(
     page_title="Market Watch Dashboard",
@@ -38,6 +37,79 @@ st.markdown("""
 def initialize_data_handler():
     return StockDataHandler(archive_dir="archive")
 
+@st.cache_data(ttl=CACHE_TTL, max_entries=CACHE_SIZE)
+def get_enriched(ticker: str) -> pd.DataFrame:
+    # Indicators cover the full history, so only the date_range slicing
+    # changes between reruns - compute them once per ticker, not per widget.
+    df = initialize_data_handler().load_stock_data(ticker)
+    return FeatureEngineer.add_technical_indicators(df)
+
+def _load_enriched_set(tickers: tuple) -> dict:
+    data = {}
+    # Scoped suppression: early history rows can produce all-NaN windows
+    # in the indicator math; don't install a process-wide filter for that.
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', category=RuntimeWarning)
+        for ticker in tickers:
+            try:
+                data[ticker] = get_enriched(ticker)
+            except FileNotFoundError as e:
+                print(f"Warning: {e}")
+    return data
+
+# Keyed by the ticker tuple so tweaking unrelated widgets (MA checkboxes,
+# date pickers) reuses the cached reduction instead of recomputing it.
+@st.cache_data(ttl=CACHE_TTL, max_entries=32)
+def cached_correlation_matrix(tickers: tuple) -> pd.DataFrame:
+    return ComparativeAnalysis.compute_correlation_matrix(_load_enriched_set(tickers))
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=32)
+def cached_risk_return_profile(tickers: tuple) -> pd.DataFrame:
+    return ComparativeAnalysis.create_risk_return_profile(_load_enriched_set(tickers))
+
+# Figure builders are deterministic in (ticker, date_range, widget args),
+# so reruns that touched an unrelated widget replay the cached figure
+# instead of rebuilding every trace.
+@st.cache_data(ttl=CACHE_TTL, max_entries=32)
+def cached_candlestick(ticker: str, date_range: tuple, moving_averages: tuple, weekly: bool):
+    df = get_enriched(ticker)
+    if weekly:
+        df = resample_weekly_ohlc(df)
+    return FinancialCharts.create_candlestick_with_volume(
+        df, ticker, moving_averages=list(moving_averages), date_range=date_range
+    )
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=32)
+def cached_price_returns(ticker: str, date_range: tuple):
+    return FinancialCharts.create_price_and_returns_chart(
+        get_enriched(ticker), ticker, date_range=date_range
+    )
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=32)
+def cached_returns_histogram(ticker: str):
+    return FinancialCharts.create_daily_returns_histogram(get_enriched(ticker), ticker)
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=32)
+def cached_volatility(ticker: str, window: int, date_range: tuple):
+    return FinancialCharts.create_volatility_chart(
+        get_enriched(ticker), ticker, window=window, date_range=date_range
+    )
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=32)
+def cached_multi_returns(tickers: tuple, date_range: tuple):
+    return ComparativeCharts.create_multi_stock_returns_chart(
+        _load_enriched_set(tickers), date_range=date_range
+    )
+
+def resample_weekly_ohlc(df: pd.DataFrame) -> pd.DataFrame:
+    # Plotly draws each candle as a separate shape, so long ranges are
+    # aggregated to weekly bars to keep the rendered node count down.
+    agg = {'Open': 'first', 'High': 'max', 'Low': 'min', 'Close': 'last', 'Volume': 'sum'}
+    for col in df.columns:
+        if col.startswith('MA') or col == 'Cum_Ret':
+            agg[col] = 'last'
+    return df.resample('W').agg(agg).dropna(subset=['Close'])
+
 st.sidebar.markdown("# Market Watch Configuration")
 st.sidebar.markdown("---")
 
@@ -55,14 +127,17 @@ st.sidebar.markdown("---")
 st.sidebar.markdown("### Date Range")
 
 try:
-    ticker_data = handler.load_stock_data(selected_ticker)
+    # Single load per rerun: the date picker and the analysis section below
+    # share this frame instead of each going back to the handler.
+    ticker_data = get_enriched(selected_ticker)
     min_date = ticker_data.index.min().date()
     max_date = ticker_data.index.max().date()
-    
+
     default_start = max(min_date, max_date - timedelta(days=365))
     default_end = max_date
 except Exception as e:
     st.sidebar.error(f"Error loading date range: {str(e)}")
+    ticker_data = None
     min_date = datetime.now().date() - timedelta(days=365*10)
     max_date = datetime.now().date()
     default_start = max(min_date, max_date - timedelta(days=365))
@@ -101,17 +176,17 @@ st.sidebar.markdown("### Technical Indicators")
 show_ma20 = st.sidebar.checkbox(
     "20-Day MA", 
     value=True,
-    help=GLOSSARY.get('ma20', {}).get('brief', '')
+    help=get_term_tooltip('ma20')
 )
 show_ma50 = st.sidebar.checkbox(
     "50-Day MA", 
     value=True,
-    help=GLOSSARY.get('ma50', {}).get('brief', '')
+    help=get_term_tooltip('ma50')
 )
 show_ma200 = st.sidebar.checkbox(
     "200-Day MA", 
     value=False,
-    help=GLOSSARY.get('ma200', {}).get('brief', '')
+    help=get_term_tooltip('ma200')
 )
 
 moving_averages = []
@@ -166,11 +241,13 @@ st.markdown("## Single Stock Analysis")
 
 try:
     with st.spinner(f"Loading data for {selected_ticker}..."):
-        stock_data = handler.load_stock_data(selected_ticker)
-        stock_data = FeatureEngineer.add_technical_indicators(stock_data)
+        stock_data = ticker_data if ticker_data is not None else get_enriched(selected_ticker)
     
     col1, col2, col3, col4 = st.columns(4)
-    
+
+    # One fused pass over Close for all four headline metrics.
+    _, ret_std, annual_return, sharpe_ratio = FeatureEngineer.compute_summary_stats(stock_data)
+
     with col1:
         current_price = stock_data['Close'].iloc[-1]
         prev_close = stock_data['Close'].iloc[-2]
@@ -181,41 +258,43 @@ try:
             label="Current Price",
             value=f"${current_price:.2f}",
             delta=f"{price_change_pct:+.2f}%",
-            help=GLOSSARY.get('close', {}).get('brief', '')
+            help=get_term_tooltip('close')
         )
     
     with col2:
-        annual_return = FeatureEngineer.compute_annual_return(stock_data)
         st.metric(
             label="Annual Return",
             value=f"{annual_return:.2%}",
-            help=GLOSSARY.get('annual_return', {}).get('brief', '')
+            help=get_term_tooltip('annual_return')
         )
     
     with col3:
-        sharpe_ratio = FeatureEngineer.compute_sharpe_ratio(stock_data)
         st.metric(
             label="Sharpe Ratio",
             value=f"{sharpe_ratio:.2f}",
-            help=GLOSSARY.get('sharpe_ratio', {}).get('brief', '')
+            help=get_term_tooltip('sharpe_ratio')
         )
     
     with col4:
-        volatility = stock_data['Close'].pct_change().std() * np.sqrt(252) * 100
+        volatility = ret_std * np.sqrt(252) * 100
         st.metric(
             label="Annual Volatility",
             value=f"{volatility:.2f}%",
-            help=GLOSSARY.get('volatility', {}).get('brief', '')
+            help=get_term_tooltip('volatility')
         )
     
     st.markdown("---")
     
+    range_days = (pd.Timestamp(date_range[1]) - pd.Timestamp(date_range[0])).days
+    candle_weekly = range_days > DOWNSAMPLE_THRESHOLD
+    candle_label = " (weekly)" if candle_weekly else ""
+
     col_title, col_help = st.columns([0.85, 0.15])
     with col_title:
-        st.subheader(f"{selected_ticker} - Candlestick Chart")
+        st.subheader(f"{selected_ticker} - Candlestick Chart{candle_label}")
     with col_help:
         st.markdown(f"[?](https://www.investopedia.com/terms/c/candlestick.asp)", 
-                   help=GLOSSARY.get('candlestick', {}).get('brief', ''))
+                   help=get_term_tooltip('candlestick'))
     
     st.info(
         "**What you're looking at**: Each candle shows Open, High, Low, Close prices. "
@@ -223,11 +302,11 @@ try:
         icon="ℹ️"
     )
     
-    candlestick_fig = FinancialCharts.create_candlestick_with_volume(
-        stock_data,
+    candlestick_fig = cached_candlestick(
         selected_ticker,
-        moving_averages=moving_averages if moving_averages else ['MA50'],
-        date_range=date_range
+        date_range,
+        tuple(moving_averages) if moving_averages else ('MA50',),
+        candle_weekly
     )
     st.plotly_chart(candlestick_fig, use_container_width=True)
     
@@ -236,7 +315,7 @@ try:
         st.subheader(f"{selected_ticker} - Price vs Cumulative Returns")
     with col_help:
         st.markdown(f"[?](https://www.investopedia.com/terms/c/.cumulative-return.asp)", 
-                   help=GLOSSARY.get('cumulative_return', {}).get('brief', ''))
+                   help=get_term_tooltip('cumulative_return'))
     
     st.info(
         "**Left axis**: Stock price. **Right axis**: Total return from day 1. "
@@ -244,11 +323,7 @@ try:
         icon="ℹ️"
     )
     
-    price_returns_fig = FinancialCharts.create_price_and_returns_chart(
-        stock_data,
-        selected_ticker,
-        date_range=date_range
-    )
+    price_returns_fig = cached_price_returns(selected_ticker, date_range)
     st.plotly_chart(price_returns_fig, use_container_width=True)
 
     col1, col2 = st.columns(2)
@@ -259,9 +334,9 @@ try:
             st.subheader(f"{selected_ticker} - Daily Returns Distribution")
         with col_help:
             st.markdown(f"[?](https://www.investopedia.com/terms/d/daily-return.asp)", 
-                       help=GLOSSARY.get('daily_return', {}).get('brief', ''))
+                       help=get_term_tooltip('daily_return'))
         st.caption("Shows how often the stock had small vs big price changes")
-        returns_hist = FinancialCharts.create_daily_returns_histogram(stock_data, selected_ticker)
+        returns_hist = cached_returns_histogram(selected_ticker)
         st.plotly_chart(returns_hist, use_container_width=True)
     
     with col2:
@@ -270,14 +345,9 @@ try:
             st.subheader(f"{selected_ticker} - Rolling Volatility")
         with col_help:
             st.markdown(f"[?](https://www.investopedia.com/terms/v/volatility.asp)", 
-                       help=GLOSSARY.get('volatility', {}).get('brief', ''))
+                       help=get_term_tooltip('volatility'))
         st.caption("Measures how risky/unpredictable the stock is over time")
-        volatility_fig = FinancialCharts.create_volatility_chart(
-            stock_data,
-            selected_ticker,
-            window=30,
-            date_range=date_range
-        )
+        volatility_fig = cached_volatility(selected_ticker, 30, date_range)
         st.plotly_chart(volatility_fig, use_container_width=True)
 
 except Exception as e:
@@ -291,13 +361,7 @@ st.markdown("## Comparative Analysis")
 if len(compare_tickers) >= 2:
     try:
         with st.spinner("Loading comparative data..."):
-            multi_stock_data = handler.load_multiple_stocks(compare_tickers)
-            
-            # Add technical indicators to all stocks
-            for ticker in multi_stock_data:
-                multi_stock_data[ticker] = FeatureEngineer.add_technical_indicators(
-                    multi_stock_data[ticker]
-                )
+            multi_stock_data = _load_enriched_set(tuple(compare_tickers))
         
         # Correlation Matrix
         col_title, col_help = st.columns([0.85, 0.15])
@@ -305,7 +369,7 @@ if len(compare_tickers) >= 2:
             st.subheader("Correlation Matrix")
         with col_help:
             st.markdown(f"[?](https://www.investopedia.com/terms/c/correlation.asp)", 
-                       help=GLOSSARY.get('correlation', {}).get('brief', ''))
+                       help=get_term_tooltip('correlation'))
         
         st.markdown("""
         **How to read this chart:**
@@ -316,7 +380,7 @@ if len(compare_tickers) >= 2:
         **Tip**: For a safe portfolio, mix stocks with low/negative correlation.
         """)
         
-        corr_matrix = ComparativeAnalysis.compute_correlation_matrix(multi_stock_data)
+        corr_matrix = cached_correlation_matrix(tuple(multi_stock_data))
         corr_fig = ComparativeCharts.create_correlation_heatmap(
             corr_matrix,
             title=f"Correlation Matrix - {', '.join(compare_tickers[:5])}{'...' if len(compare_tickers) > 5 else ''}"
@@ -331,7 +395,7 @@ if len(compare_tickers) >= 2:
             st.subheader("Risk vs Return Analysis")
         with col_help:
             st.markdown(f"[?](https://www.investopedia.com/terms/r/risk-adjusted-return.asp)", 
-                       help=GLOSSARY.get('risk_adjusted_return', {}).get('brief', ''))
+                       help=get_term_tooltip('risk_adjusted_return'))
         
         st.markdown("""
         **Understanding the chart:**
@@ -342,7 +406,7 @@ if len(compare_tickers) >= 2:
         **What you want**: Top-left = High return with low risk (rare gems!)
         """)
         
-        risk_return_df = ComparativeAnalysis.create_risk_return_profile(multi_stock_data)
+        risk_return_df = cached_risk_return_profile(tuple(multi_stock_data))
         risk_return_fig = ComparativeCharts.create_risk_return_scatter(
             risk_return_df,
             title=f"Risk vs Return - {', '.join(compare_tickers[:5])}{'...' if len(compare_tickers) > 5 else ''}"
@@ -368,10 +432,7 @@ if len(compare_tickers) >= 2:
         st.subheader("Cumulative Returns Comparison")
         st.markdown("Normalized comparison starting from 0% - shows relative performance of all stocks.")
         
-        multi_returns_fig = ComparativeCharts.create_multi_stock_returns_chart(
-            multi_stock_data,
-            date_range=date_range
-        )
+        multi_returns_fig = cached_multi_returns(tuple(multi_stock_data), date_range)
         st.plotly_chart(multi_returns_fig, use_container_width=True)
         
     except Exception as e:
@@ -1,8 +1,87 @@
 import pandas as pd
 import numpy as np
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import functools
 import os
 
+from utils._njit import njit
+
+try:
+    import cupy as cp
+except ImportError:
+    # CuPy (and a CUDA device) is optional - without it the correlation
+    # fast path stays on the CPU BLAS route.
+    cp = None
+
+# Below this many tickers the host<->device transfer costs more than the
+# GEMM saves; stay on the CPU.
+_GPU_CORR_MIN_COLS = 64
+
+
+@njit(cache=True, nogil=True)
+def _ma_and_vol(close, windows, vol_window):
+    # Single O(n) pass over the Close array: running-sum moving averages for
+    # each window plus a rolling std of daily returns in the last column.
+    n = close.shape[0]
+    n_windows = windows.shape[0]
+    out = np.full((n, n_windows + 1), np.nan)
+
+    # All windows share one traversal of close: each keeps its own running
+    # sum, so the array is streamed through cache once instead of per window.
+    sums = np.zeros(n_windows)
+    for i in range(n):
+        x = close[i]
+        for j in range(n_windows):
+            w = windows[j]
+            sums[j] += x
+            if i >= w:
+                sums[j] -= close[i - w]
+            if i + 1 >= w:
+                out[i, j] = sums[j] / w
+
+    # Rolling std of pct-change returns (ddof=1, matching pandas).
+    ret_sum = 0.0
+    ret_sumsq = 0.0
+    for i in range(1, n):
+        ret = close[i] / close[i - 1] - 1.0
+        ret_sum += ret
+        ret_sumsq += ret * ret
+        if i > vol_window:
+            old = close[i - vol_window] / close[i - vol_window - 1] - 1.0
+            ret_sum -= old
+            ret_sumsq -= old * old
+        if i >= vol_window:
+            mean = ret_sum / vol_window
+            var = (ret_sumsq - vol_window * mean * mean) / (vol_window - 1)
+            if var < 0.0:
+                var = 0.0
+            out[i, n_windows] = np.sqrt(var)
+
+    return out
+
+
+@njit(cache=True, nogil=True)
+def _summary_stats(close, risk_free_rate):
+    # Fused reduction over the Close array: daily-return mean/std (ddof=1),
+    # annualized return and Sharpe in one traversal, no intermediate Series.
+    n = close.shape[0]
+    m = n - 1
+    ret_sum = 0.0
+    ret_sumsq = 0.0
+    for i in range(1, n):
+        ret = close[i] / close[i - 1] - 1.0
+        ret_sum += ret
+        ret_sumsq += ret * ret
+    mean = ret_sum / m
+    var = (ret_sumsq - m * mean * mean) / (m - 1)
+    std = np.sqrt(var) if var > 0.0 else 0.0
+    annual_return = (close[-1] / close[0]) ** (252.0 / n) - 1.0
+    sharpe = 0.0
+    if std > 0.0:
+        sharpe = (mean - risk_free_rate / 252.0) / std * np.sqrt(252.0)
+    return mean, std, annual_return, sharpe
+
 
 class StockDataHandler:
     def __init__(self, archive_dir: str = "archive"):
@@ -11,51 +90,97 @@ class StockDataHandler:
         self._discover_tickers()
     
     def _discover_tickers(self):
-        self.available_tickers = []
-        
         if not self.archive_dir.exists():
             raise FileNotFoundError(f"Archive directory not found: {self.archive_dir}")
-        
-        for csv_file in sorted(self.archive_dir.glob("*_stock_market_data.csv")):
-            ticker = csv_file.stem.replace("_stock_market_data", "")
-            self.available_tickers.append(ticker)
-        
+
+        # Immutable tuple: Streamlit re-hashes widget options every rerun,
+        # and tuples hash once. frozenset gives O(1) membership checks.
+        self.available_tickers = tuple(
+            csv_file.stem.replace("_stock_market_data", "")
+            for csv_file in sorted(self.archive_dir.glob("*_stock_market_data.csv"))
+        )
+        self.ticker_set = frozenset(self.available_tickers)
+
         print(f"✓ Discovered {len(self.available_tickers)} tickers")
     
     def load_stock_data(self, ticker: str) -> pd.DataFrame:
         if ticker in self.data_cache:
-            return self.data_cache[ticker].copy()
-        
+            return self.data_cache[ticker]
+
         csv_path = self.archive_dir / f"{ticker}_stock_market_data.csv"
-        
+        parquet_path = self.archive_dir / f"{ticker}.parquet"
+
+        if parquet_path.exists():
+            return self._finish_load(ticker, pd.read_parquet(parquet_path, engine='pyarrow'))
+
         if not csv_path.exists():
             raise FileNotFoundError(
                 f"Data not found for ticker {ticker}. "
                 f"Available tickers: {', '.join(self.available_tickers[:10])}..."
             )
 
-        df = pd.read_csv(csv_path)
-        df['Date'] = pd.to_datetime(df['Date'])
+        # Read only the columns the app touches, with explicit dtypes so the
+        # parser skips type inference. float32 is plenty for chart-grade
+        # precision; Volume stays int64 (several tickers peak above 9B
+        # shares/day, past the int32 limit).
+        df = pd.read_csv(
+            csv_path,
+            usecols=['Date', 'Open', 'High', 'Low', 'Close', 'Volume'],
+            dtype={
+                'Open': np.float32,
+                'High': np.float32,
+                'Low': np.float32,
+                'Close': np.float32,
+                'Volume': np.int64,
+            },
+            parse_dates=['Date'],
+            engine='pyarrow',
+        )
         df.set_index('Date', inplace=True)
         df.sort_index(inplace=True)
-        
+
+        # Persist a typed, pre-sorted columnar sibling so subsequent cold
+        # loads skip CSV parsing and the string->datetime conversion.
+        try:
+            df.to_parquet(parquet_path, compression='zstd', index=True)
+        except (ImportError, OSError):
+            pass  # no parquet engine available / read-only archive
+
+        return self._finish_load(ticker, df)
+
+    def _finish_load(self, ticker: str, df: pd.DataFrame) -> pd.DataFrame:
         df['Ticker'] = ticker
 
-        self.data_cache[ticker] = df.copy()
-        
+        # Share the cached frame directly instead of handing out copies -
+        # every consumer that mutates (add_technical_indicators) already
+        # takes its own df.copy() first.
+        self.data_cache[ticker] = df
+
         return df
-    
+
     def get_stock_data(self, ticker: str) -> pd.DataFrame:
         return self.load_stock_data(ticker)
     
     def load_multiple_stocks(self, tickers: list) -> dict:
-        data = {}
-        for ticker in tickers:
-            try:
-                data[ticker] = self.load_stock_data(ticker)
-            except FileNotFoundError as e:
-                print(f"Warning: {e}")
-        return data
+        if not tickers:
+            return {}
+
+        # Loads are I/O-bound and pandas releases the GIL while parsing,
+        # so a thread pool gets near-linear speedup on cold loads.
+        results = {}
+        with ThreadPoolExecutor(max_workers=min(len(tickers), os.cpu_count() or 1)) as executor:
+            futures = {
+                executor.submit(self.load_stock_data, ticker): ticker
+                for ticker in tickers
+            }
+            for future in as_completed(futures):
+                ticker = futures[future]
+                try:
+                    results[ticker] = future.result()
+                except FileNotFoundError as e:
+                    print(f"Warning: {e}")
+
+        return {ticker: results[ticker] for ticker in tickers if ticker in results}
     
     def load_all_stocks(self) -> dict:
         return self.load_multiple_stocks(self.available_tickers)
@@ -73,88 +198,134 @@ class FeatureEngineer:
     
     @staticmethod
     def compute_moving_average(df: pd.DataFrame, window: int = 50) -> pd.Series:
-        return df['Close'].rolling(window=window).mean()
-    
+        close = df['Close'].to_numpy(dtype=np.float64)
+        result = _ma_and_vol(close, np.array([window], dtype=np.int64), window)
+        return pd.Series(result[:, 0], index=df.index)
+
     @staticmethod
     def add_technical_indicators(df: pd.DataFrame, ma_windows: list = None) -> pd.DataFrame:
         if ma_windows is None:
             ma_windows = [20, 50, 200]
-        
+
         df = df.copy()
-        
+
         df['Daily_Ret'] = FeatureEngineer.compute_daily_returns(df)
 
         df['Cum_Ret'] = FeatureEngineer.compute_cumulative_returns(df)
 
-        for window in ma_windows:
-            df[f'MA{window}'] = FeatureEngineer.compute_moving_average(df, window=window)
-        
+        close = df['Close'].to_numpy(dtype=np.float64)
+        windows = np.asarray(ma_windows, dtype=np.int64)
+        indicators = _ma_and_vol(close, windows, 30)
+        for j, window in enumerate(ma_windows):
+            df[f'MA{window}'] = indicators[:, j]
+
         return df
-    
+
+    @staticmethod
+    def add_technical_indicators_multi(stock_data_dict: dict) -> dict:
+        if not stock_data_dict:
+            return {}
+
+        # Enrichment is independent per ticker and the kernels run nogil,
+        # so a thread pool spreads the work across cores (same pattern as
+        # load_multiple_stocks).
+        tickers = list(stock_data_dict)
+        with ThreadPoolExecutor(max_workers=min(len(tickers), os.cpu_count() or 1)) as executor:
+            enriched = executor.map(
+                FeatureEngineer.add_technical_indicators,
+                (stock_data_dict[ticker] for ticker in tickers),
+            )
+            return dict(zip(tickers, enriched))
+
     @staticmethod
     def compute_volatility(df: pd.DataFrame, window: int = 30) -> pd.Series:
-        daily_ret = FeatureEngineer.compute_daily_returns(df)
-        return daily_ret.rolling(window=window).std()
+        close = df['Close'].to_numpy(dtype=np.float64)
+        result = _ma_and_vol(close, np.empty(0, dtype=np.int64), window)
+        return pd.Series(result[:, -1], index=df.index)
     
+    @staticmethod
+    def compute_summary_stats(df: pd.DataFrame, risk_free_rate: float = 0.02) -> tuple:
+        close = df['Close'].to_numpy(dtype=np.float64)
+        return _summary_stats(close, risk_free_rate)
+
     @staticmethod
     def compute_annual_return(df: pd.DataFrame) -> float:
-        total_return = (df['Close'].iloc[-1] - df['Close'].iloc[0]) / df['Close'].iloc[0]
-        years = len(df) / 252  # 252 trading days per year
-        annual_return = (1 + total_return) ** (1 / years) - 1
-        return annual_return
-    
+        return FeatureEngineer.compute_summary_stats(df)[2]
+
     @staticmethod
     def compute_sharpe_ratio(df: pd.DataFrame, risk_free_rate: float = 0.02) -> float:
-        daily_ret = FeatureEngineer.compute_daily_returns(df).dropna()
-        excess_ret = daily_ret.mean() - (risk_free_rate / 252)  # Daily risk-free rate
-        volatility = daily_ret.std()
-        sharpe = (excess_ret / volatility) * np.sqrt(252)  # Annualize
-        return sharpe
+        return FeatureEngineer.compute_summary_stats(df, risk_free_rate)[3]
 
 
 class ComparativeAnalysis:
     @staticmethod
     def create_returns_pivot(stock_data_dict: dict, use_close: bool = False) -> pd.DataFrame:
         column_name = 'Close' if use_close else 'Daily_Ret'
-        
-        for ticker in stock_data_dict:
-            if 'Daily_Ret' not in stock_data_dict[ticker].columns and not use_close:
-                stock_data_dict[ticker]['Daily_Ret'] = (
-                    stock_data_dict[ticker]['Close'].pct_change()
-                )
-
-        pivot_data = []
-        for ticker, df in stock_data_dict.items():
-            pivot_data.append(df[[column_name]].rename(columns={column_name: ticker}))
-        
-        pivot_df = pd.concat(pivot_data, axis=1)
-        return pivot_df
+
+        tickers = list(stock_data_dict)
+
+        # Union of all date indexes, then one preallocated (dates x tickers)
+        # array filled positionally - avoids pd.concat's per-column alignment.
+        idx = functools.reduce(
+            np.union1d, (df.index.values for df in stock_data_dict.values())
+        )
+        out = np.full((idx.size, len(tickers)), np.nan, dtype=np.float64)
+
+        for j, ticker in enumerate(tickers):
+            df = stock_data_dict[ticker]
+            if column_name in df.columns:
+                values = df[column_name].to_numpy(dtype=np.float64)
+            else:
+                close = df['Close'].to_numpy(dtype=np.float64)
+                values = np.empty_like(close)
+                values[0] = np.nan
+                values[1:] = np.diff(close) / close[:-1]
+            out[np.searchsorted(idx, df.index.values), j] = values
+
+        return pd.DataFrame(out, index=pd.DatetimeIndex(idx), columns=tickers)
     
     @staticmethod
     def compute_correlation_matrix(stock_data_dict: dict) -> pd.DataFrame:
         pivot_df = ComparativeAnalysis.create_returns_pivot(stock_data_dict, use_close=False)
+
+        # One BLAS-backed np.corrcoef call when the histories mostly overlap;
+        # pandas' O(N^2) pairwise-NaN .corr() only when they don't.
+        arr = pivot_df.to_numpy(dtype=np.float32, copy=False)
+        complete_rows = ~np.isnan(arr).any(axis=1)
+        if complete_rows.size and complete_rows.mean() >= 0.9:
+            rows = arr[complete_rows]
+            # Wide universes: corrcoef is one GEMM, so run it on the GPU
+            # when CuPy is importable and only ship the NxN result back.
+            if cp is not None and rows.shape[1] >= _GPU_CORR_MIN_COLS:
+                corr = cp.corrcoef(cp.asarray(rows), rowvar=False).get()
+            else:
+                corr = np.corrcoef(rows, rowvar=False)
+            return pd.DataFrame(corr, index=pivot_df.columns, columns=pivot_df.columns)
+
         return pivot_df.corr()
     
     @staticmethod
     def create_risk_return_profile(stock_data_dict: dict) -> pd.DataFrame:
-        profile = []
-        
-        for ticker, df in stock_data_dict.items():
-            daily_ret = df['Close'].pct_change().dropna()
-            
-            risk = daily_ret.std()  # Daily volatility
-            daily_return = daily_ret.mean()
-            annual_return = daily_return * 252  # Annualize
-            sharpe = (daily_return / risk * np.sqrt(252)) if risk > 0 else 0
-            
-            profile.append({
-                'Ticker': ticker,
-                'Risk': risk,
-                'Annual_Return': annual_return,
-                'Sharpe': sharpe
-            })
-        
-        return pd.DataFrame(profile).sort_values('Sharpe', ascending=False)
+        pivot_df = ComparativeAnalysis.create_returns_pivot(stock_data_dict, use_close=False)
+
+        # Column-wise reductions over the (dates x tickers) array replace
+        # the per-ticker pct_change/std/mean pandas dispatches.
+        arr = pivot_df.to_numpy(dtype=np.float64)
+        daily_return = np.nanmean(arr, axis=0)
+        risk = np.nanstd(arr, axis=0, ddof=1)  # Daily volatility
+        annual_return = daily_return * 252  # Annualize
+        sharpe = np.where(risk > 0, daily_return / risk * np.sqrt(252), 0.0)
+
+        # Order the raw arrays with one argsort instead of a pandas
+        # sort_values pass (which builds a temporary indexer) afterwards.
+        order = np.argsort(-sharpe, kind='stable')
+
+        return pd.DataFrame({
+            'Ticker': np.asarray(pivot_df.columns)[order],
+            'Risk': risk[order],
+            'Annual_Return': annual_return[order],
+            'Sharpe': sharpe[order]
+        })
 
 
 if __name__ == "__main__":
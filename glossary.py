@@ -1,6 +1,17 @@
+import re
+import string
+from functools import lru_cache
+from types import MappingProxyType
+from typing import NamedTuple
+
 import streamlit as st
 
-GLOSSARY = {
+
+class _Entry(NamedTuple):
+    brief: str
+    url: str
+
+_RAW_GLOSSARY = {
     "ticker": {
         "brief": "A unique symbol representing a company's stock on the market (e.g., AAPL for Apple)",
         "url": "https://www.investopedia.com/terms/t/tickersymbol.asp"
@@ -113,97 +124,167 @@ GLOSSARY = {
     },
 }
 
+# Flat read-only entries: one hash+probe per lookup instead of the nested
+# .get(...).get(...) chain, and tuple storage instead of per-entry dicts
+# (~200 bytes of dict overhead saved per term). _Entry unpacks like a plain
+# tuple but also reads as .brief/.url.
+GLOSSARY = MappingProxyType({
+    key: _Entry(value["brief"], value["url"]) for key, value in _RAW_GLOSSARY.items()
+})
+
+_MISSING_ENTRY = _Entry("", "")
+
+# Human-readable names, constant-folded at import instead of
+# .replace('_', ' ').title() per term per render.
+_DISPLAY_NAMES = {key: key.replace('_', ' ').title() for key in GLOSSARY}
+
+_CATEGORIES = {
+    "Stock Basics": ("ticker", "open", "close", "high", "low", "volume"),
+    "Returns": ("annual_return", "cumulative_return", "daily_return"),
+    "Risk Metrics": ("volatility", "sharpe_ratio", "risk", "standard_deviation"),
+    "Technical Analysis": ("moving_average", "ma20", "ma50", "ma200", "candlestick", "technical_indicator"),
+    "Comparative Analysis": ("correlation", "portfolio_diversification", "risk_adjusted_return"),
+    "Market Terms": ("bullish", "bearish", "trend"),
+}
+
+
+def _lookup(term_key: str) -> tuple:
+    return GLOSSARY.get(term_key, _MISSING_ENTRY)
+
+
+# Lowercase + space->underscore in one string pass instead of the chained
+# .lower().replace(" ", "_") allocations.
+_KEY_TABLE = str.maketrans({" ": "_", **{c: c.lower() for c in string.ascii_uppercase}})
+
+
+@lru_cache(maxsize=256)
+def _normalize(term: str) -> str:
+    return term.translate(_KEY_TABLE)
+
+
+# Hoisted out of create_term_link and stripped of the triple-quoted
+# indentation whitespace - smaller payload per term, formatted in one call.
+_TERM_LINK_TPL = (
+    '<span style="border-bottom: 2px dotted #1f77b4; cursor: help; position: relative;">'
+    '<a href="{url}" target="_blank" style="color: #1f77b4; text-decoration: none; '
+    'font-weight: 500;">{term}</a>'
+    '<span style="visibility: hidden; width: 250px; background-color: #333; color: #fff; '
+    'text-align: center; border-radius: 6px; padding: 8px; position: absolute; z-index: 1; '
+    'bottom: 125%; left: 50%; margin-left: -125px; opacity: 0; transition: opacity 0.3s; '
+    'font-size: 12px; line-height: 1.4;">{brief}</span>'
+    '</span>'
+)
+
+# Minimal variant for entries without a tooltip - no point shipping an
+# invisible 400-byte tooltip <span> to the browser.
+_TERM_LINK_PLAIN_TPL = (
+    '<a href="{url}" target="_blank" style="color: #1f77b4; text-decoration: none; '
+    'font-weight: 500;">{term}</a>'
+)
+
 
 def get_term_tooltip(term_key: str) -> str:
-    return GLOSSARY.get(term_key.lower(), {}).get("brief", "")
+    return _lookup(term_key.lower())[0]
 
 
 def get_term_url(term_key: str) -> str:
-    return GLOSSARY.get(term_key.lower(), {}).get("url", "")
+    return _lookup(term_key.lower())[1]
 
 
+@lru_cache(maxsize=512)
 def create_term_link(term: str, term_key: str = None) -> str:
     if term_key is None:
-        term_key = term.lower().replace(" ", "_")
-    
-    brief = get_term_tooltip(term_key)
-    url = get_term_url(term_key)
-    
+        term_key = _normalize(term)
+
+    # One dict probe instead of separate tooltip/url getters; keys in
+    # GLOSSARY are already lowercase so no re-normalization either.
+    brief, url = _lookup(term_key)
+
     if not url:
         return term
-    
-    html = f"""
-    <span style="border-bottom: 2px dotted #1f77b4; cursor: help; position: relative;">
-        <a href="{url}" target="_blank" style="color: #1f77b4; text-decoration: none; font-weight: 500;">
-            {term}
-        </a>
-        <span style="visibility: hidden; width: 250px; background-color: #333; color: #fff; text-align: center; 
-                     border-radius: 6px; padding: 8px; position: absolute; z-index: 1; bottom: 125%; left: 50%; 
-                     margin-left: -125px; opacity: 0; transition: opacity 0.3s; font-size: 12px; line-height: 1.4;">
-            {brief}
-        </span>
-    </span>
-    """
-    return html
+
+    if not brief:
+        return _TERM_LINK_PLAIN_TPL.format(url=url, term=term)
+
+    return _TERM_LINK_TPL.format(url=url, term=term, brief=brief)
 
 
 def display_term_with_help(term: str, term_key: str = None):
     if term_key is None:
-        term_key = term.lower().replace(" ", "_")
-    
-    brief = get_term_tooltip(term_key)
-    url = get_term_url(term_key)
-    
+        term_key = _normalize(term)
+
+    brief, url = _lookup(term_key)
+
     if url:
-        st.markdown(
-            f"[{term}]({url})" + 
-            (f" {st.tooltip(brief)}" if brief else ""),
-            unsafe_allow_html=False
-        )
+        # Markdown link-title syntax gives the hover text natively; the old
+        # st.tooltip(...) call fired a widget just to discard its repr.
+        if brief:
+            st.markdown(f'[{term}]({url} "{brief.replace(chr(34), "")}")')
+        else:
+            st.markdown(f"[{term}]({url})")
     else:
         st.write(term)
 
 
 def create_info_box_with_terms(content: str, terms_dict: dict = None) -> str:
-    if terms_dict is None:
-        terms_dict = {}
-    
-    result = content
-    for display_term, glossary_key in terms_dict.items():
-        html_term = create_term_link(display_term, glossary_key)
-        result = result.replace(display_term, html_term)
-    
-    return result
+    # Fast path: nothing to link, return the content untouched.
+    if not terms_dict:
+        return content
+
+    # The dict is converted to a sorted tuple so repeated calls with the
+    # same content/terms hit the memoized renderer.
+    return _render_info_box(content, tuple(sorted(terms_dict.items())))
+
+
+@lru_cache(maxsize=64)
+def _terms_pattern(terms: tuple) -> re.Pattern:
+    # Longest-first alternation so shorter terms can't steal a prefix of a
+    # longer one (e.g. "return" inside "annual return").
+    return re.compile("|".join(map(re.escape, sorted(terms, key=len, reverse=True))))
+
+
+@lru_cache(maxsize=128)
+def _render_info_box(content: str, terms_items: tuple) -> str:
+    if not terms_items:
+        return content
+
+    # One scan of content with an alternation regex instead of a full
+    # str.replace rebuild per term; also means HTML inserted for one term
+    # can never be re-matched by a later term.
+    terms = dict(terms_items)
+    pattern = _terms_pattern(tuple(terms))
+    return pattern.sub(lambda m: create_term_link(m.group(0), terms[m.group(0)]), content)
+
+
+@st.cache_data
+def _build_glossary_markdown() -> str:
+    # The glossary is fully static, so the whole panel is assembled once
+    # per session instead of issuing ~30 widget calls per rerun.
+    parts = ["### Common Financial Terms"]
+    for category, terms in _CATEGORIES.items():
+        parts.append(f"**{category}**")
+
+        cells = []
+        for term in terms:
+            brief, url = _lookup(term)
+            name = _DISPLAY_NAMES.get(term, term)
+
+            if url:
+                cells.append(f'<div><a href="{url}" target="_blank"><b>{name}</b></a>: {brief}</div>')
+            else:
+                cells.append(f'<div><b>{name}</b>: {brief}</div>')
+
+        # Two-column layout as one CSS grid block per category - a single
+        # markdown payload instead of an st.columns pair with per-term calls.
+        parts.append(
+            '<div style="display: grid; grid-template-columns: 1fr 1fr; gap: 8px;">'
+            + ''.join(cells)
+            + '</div>'
+        )
+
+    return "\n\n".join(parts)
 
 
 def add_glossary_section():
     with st.expander("Financial Glossary - Learn Terms"):
-        st.markdown("### Common Financial Terms")
-        
-        categories = {
-            "Stock Basics": ["ticker", "open", "close", "high", "low", "volume"],
-            "Returns": ["annual_return", "cumulative_return", "daily_return"],
-            "Risk Metrics": ["volatility", "sharpe_ratio", "risk", "standard_deviation"],
-            "Technical Analysis": ["moving_average", "ma20", "ma50", "ma200", "candlestick", "technical_indicator"],
-            "Comparative Analysis": ["correlation", "portfolio_diversification", "risk_adjusted_return"],
-            "Market Terms": ["bullish", "bearish", "trend"]
-        }
-        
-        for category, terms in categories.items():
-            st.markdown(f"**{category}**")
-            
-            cols = st.columns(2)
-            for idx, term in enumerate(terms):
-                col = cols[idx % 2]
-                brief = get_term_tooltip(term)
-                url = get_term_url(term)
-                
-                if url:
-                    col.markdown(
-                        f"**[{term.replace('_', ' ').title()}]({url})**: {brief}",
-                        unsafe_allow_html=True
-                    )
-                else:
-                    col.markdown(f"**{term.replace('_', ' ').title()}**: {brief}")
-            
-            st.markdown("") 
+        st.markdown(_build_glossary_markdown(), unsafe_allow_html=True)
@@ -6,12 +6,27 @@ from pathlib import Path
 
 from data_handler import StockDataHandler, FeatureEngineer, ComparativeAnalysis
 
+# One handler (and one AAPL load) shared by every test class instead of a
+# fresh instance plus re-discovery/re-parse per class.
+_HANDLER = None
+
+
+def _shared_handler() -> StockDataHandler:
+    global _HANDLER
+    if _HANDLER is None:
+        _HANDLER = StockDataHandler(archive_dir="archive")
+    return _HANDLER
+
+
+def _shared_aapl():
+    return _shared_handler().load_stock_data("AAPL")
+
 
 class TestDataHandler(unittest.TestCase):
-    
+
     @classmethod
     def setUpClass(cls):
-        cls.handler = StockDataHandler(archive_dir="archive")
+        cls.handler = _shared_handler()
     
     def test_discover_tickers(self):
         self.assertGreater(len(self.handler.available_tickers), 0)
@@ -58,8 +73,9 @@ class TestDataHandler(unittest.TestCase):
 class TestFeatureEngineer(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
-        cls.handler = StockDataHandler(archive_dir="archive")
-        cls.df = cls.handler.load_stock_data("AAPL")
+        cls.handler = _shared_handler()
+        cls.df = _shared_aapl()
+        cls.close_np = cls.df['Close'].to_numpy(dtype=np.float64)
     
     def test_daily_returns(self):
         ret = FeatureEngineer.compute_daily_returns(self.df)
@@ -68,11 +84,13 @@ class TestFeatureEngineer(unittest.TestCase):
 
         self.assertTrue(pd.isna(ret.iloc[0]))
 
-        expected_ret = (self.df['Close'].iloc[1] - self.df['Close'].iloc[0]) / self.df['Close'].iloc[0]
+        expected_ret = (self.close_np[1] - self.close_np[0]) / self.close_np[0]
         self.assertAlmostEqual(ret.iloc[1], expected_ret, places=6)
         
-        self.assertTrue((ret.dropna() > -1).all())
-        self.assertTrue((ret.dropna() < 1).all())
+        arr = ret.to_numpy()
+        valid = arr[~np.isnan(arr)]
+        self.assertTrue(np.all(valid > -1))
+        self.assertTrue(np.all(valid < 1))
     
     def test_cumulative_returns(self):
         cum_ret = FeatureEngineer.compute_cumulative_returns(self.df)
@@ -92,9 +110,8 @@ class TestFeatureEngineer(unittest.TestCase):
         self.assertEqual(ma50.isna().sum(), 49)
 
         self.assertTrue(ma50.iloc[49] > 0)
- 
-        prices = self.df['Close'].iloc[0:50]
-        expected_ma = prices.mean()
+
+        expected_ma = self.close_np[:50].mean()
         self.assertAlmostEqual(ma50.iloc[49], expected_ma, places=2)
     
     def test_add_technical_indicators(self):
@@ -133,14 +150,11 @@ class TestComparativeAnalysis(unittest.TestCase):
     
     @classmethod
     def setUpClass(cls):
-        cls.handler = StockDataHandler(archive_dir="archive")
+        cls.handler = _shared_handler()
         cls.tickers = ['AAPL', 'MSFT', 'GOOGL', 'AMZN', 'NVDA']
-        cls.stock_data = cls.handler.load_multiple_stocks(cls.tickers)
-
-        for ticker in cls.stock_data:
-            cls.stock_data[ticker] = FeatureEngineer.add_technical_indicators(
-                cls.stock_data[ticker]
-            )
+        cls.stock_data = FeatureEngineer.add_technical_indicators_multi(
+            cls.handler.load_multiple_stocks(cls.tickers)
+        )
     
     def test_returns_pivot(self):
         pivot = ComparativeAnalysis.create_returns_pivot(self.stock_data)
@@ -183,41 +197,44 @@ class TestComparativeAnalysis(unittest.TestCase):
 
 class TestDataIntegrity(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # All four tests scan the same frame; compute every counter in one
+        # pass here and let the tests assert on the cached results.
+        df = _shared_aapl()
+        df_clean = df['2000-01-01':]
+
+        # Zero-copy ndarray views; np.count_nonzero skips the boolean
+        # Series construction and index alignment of the pandas operators.
+        high = df_clean['High'].to_numpy(copy=False)
+        low = df_clean['Low'].to_numpy(copy=False)
+        volume = df_clean['Volume'].to_numpy(copy=False)
+
+        cls.stats = {
+            'open_na': int(np.count_nonzero(np.isnan(df['Open'].to_numpy(copy=False)))),
+            'high_na': int(np.count_nonzero(np.isnan(df['High'].to_numpy(copy=False)))),
+            'low_na': int(np.count_nonzero(np.isnan(df['Low'].to_numpy(copy=False)))),
+            'close_na': int(np.count_nonzero(np.isnan(df['Close'].to_numpy(copy=False)))),
+            'hl_violations': int(np.count_nonzero(high < low)),
+            'clean_rows': len(df_clean),
+            'pos_vol_frac': float(np.count_nonzero(volume > 0) / volume.size),
+            'monotonic': bool(df.index.is_monotonic_increasing),
+        }
+
     def test_no_missing_ohlc(self):
-        handler = StockDataHandler(archive_dir="archive")
-        df = handler.load_stock_data("AAPL")
-        
-        self.assertEqual(df['Open'].isna().sum(), 0)
-        self.assertEqual(df['High'].isna().sum(), 0)
-        self.assertEqual(df['Low'].isna().sum(), 0)
-        self.assertEqual(df['Close'].isna().sum(), 0)
-    
+        self.assertEqual(self.stats['open_na'], 0)
+        self.assertEqual(self.stats['high_na'], 0)
+        self.assertEqual(self.stats['low_na'], 0)
+        self.assertEqual(self.stats['close_na'], 0)
+
     def test_high_low_constraints(self):
-        handler = StockDataHandler(archive_dir="archive")
-        df = handler.load_stock_data("AAPL")
-        
-        df_clean = df['2000-01-01':]
+        self.assertLess(self.stats['hl_violations'], self.stats['clean_rows'] * 0.05)
 
-        violations = (df_clean['High'] < df_clean['Low']).sum()
-        self.assertLess(violations, len(df_clean) * 0.05) 
-    
     def test_positive_volume(self):
+        self.assertGreater(self.stats['pos_vol_frac'], 0.95)
 
-        handler = StockDataHandler(archive_dir="archive")
-        df = handler.load_stock_data("AAPL")
-        
-        df_clean = df['2000-01-01':]
-        
-        positive_volume = (df_clean['Volume'] > 0).sum()
-        total_records = len(df_clean)
-
-        self.assertGreater(positive_volume / total_records, 0.95)
-    
     def test_sorted_index(self):
-        handler = StockDataHandler(archive_dir="archive")
-        df = handler.load_stock_data("AAPL")
-        
-        self.assertTrue(df.index.is_monotonic_increasing)
+        self.assertTrue(self.stats['monotonic'])
 
 
 def run_tests():
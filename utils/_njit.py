@@ -0,0 +1,13 @@
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional - fall back to a no-op decorator so the
+    # pure-Python/NumPy kernels still run (just without JIT compilation).
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
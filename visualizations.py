@@ -2,10 +2,105 @@ import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
+import plotly.io as pio
 from plotly.subplots import make_subplots
 import seaborn as sns
 from typing import Optional, Tuple
 
+from data_handler import FeatureEngineer
+
+try:
+    from plotly_resampler import FigureResampler
+    from plotly_resampler.aggregation import MinMaxLTTB
+    _RESAMPLER_KWARGS = dict(
+        default_downsampler=MinMaxLTTB(),  # tsdownsample-backed MinMax-LTTB
+        default_n_shown_samples=2000,
+        # Keep plain trace names: the default decorates every legend entry
+        # with an "[R] ... ~5D" aggregation tag meant for Dash debugging.
+        resampled_trace_prefix_suffix=('', ''),
+        show_mean_aggregation_size=False,
+    )
+except ImportError:
+    # plotly-resampler/tsdownsample are optional - without them the charts
+    # simply ship the full series as before.
+    FigureResampler = None
+    _RESAMPLER_KWARGS = {}
+
+
+try:
+    import orjson  # noqa: F401
+    # Plotly's orjson engine serializes numpy arrays natively and is
+    # several times faster than the stdlib encoder.
+    pio.json.config.default_engine = 'orjson'
+except ImportError:
+    pass
+
+
+# Resolved once at import: passing the template object to update_layout
+# skips the per-figure registry lookup and deep-merge of the name string.
+_TEMPLATE = pio.templates['plotly_white']
+
+# Layout shared by the x-unified time-series charts.
+_BASE_LAYOUT = dict(font=dict(size=11), hovermode='x unified', template=_TEMPLATE)
+
+
+def snapshot(fig: go.Figure, path: str, scale: int = 2) -> None:
+    """Write a static PNG of a figure for CI runs and reports.
+
+    Server-side Kaleido rendering skips the interactive Plotly.js bundle
+    entirely. Requires the optional ``kaleido`` package.
+    """
+    fig.write_image(path, engine='kaleido', width=1200, height=700, scale=scale)
+
+
+def _f32(s: pd.Series) -> np.ndarray:
+    # Chart pixels can't show float64 precision; halve the wire payload.
+    return s.to_numpy(dtype=np.float32, copy=False)
+
+
+def _resample_figure(fig: go.Figure) -> go.Figure:
+    # Keep ~2k visually representative points per line trace (MinMax-LTTB);
+    # the full-resolution data stays server-side for zoom callbacks.
+    if FigureResampler is None:
+        return fig
+    return FigureResampler(fig, **_RESAMPLER_KWARGS)
+
+
+def _slice_by_date(df: pd.DataFrame, date_range: Optional[Tuple[str, str]]) -> pd.DataFrame:
+    # Positional slice via searchsorted on the raw int64 ns index: skips
+    # the label-indexer construction df.loc repeats on every call. The
+    # index is already sorted by the loader.
+    if not date_range:
+        return df
+    idx_vals = df.index.values
+    # Cast the bounds to the index's own datetime64 unit before viewing as
+    # int64, so the comparison scale always matches.
+    bounds = np.array(date_range, dtype=idx_vals.dtype).view('i8')
+    i8 = idx_vals.view('i8')
+    lo = np.searchsorted(i8, bounds[0], side='left')
+    hi = np.searchsorted(i8, bounds[1], side='right')
+    return df.iloc[lo:hi]
+
+
+def _cum_ret(close: np.ndarray) -> np.ndarray:
+    # Cumulative return straight from the closes: one diff/divide plus a
+    # cumprod, no intermediate Series or frame copy.
+    r = np.empty(close.size)
+    r[0] = 0.0
+    r[1:] = close[1:] / close[:-1] - 1.0
+    return np.cumprod(1.0 + r) - 1.0
+
+
+def _line_segments(x, y_start, y_end):
+    # Interleave (start, end, NaN) per candle so one Scattergl trace draws
+    # every vertical segment in a single WebGL batch.
+    xs = np.repeat(x, 3)
+    ys = np.empty(3 * y_start.size, dtype=np.float32)
+    ys[0::3] = y_start
+    ys[1::3] = y_end
+    ys[2::3] = np.nan
+    return xs, ys
+
 
 class FinancialCharts:
 
@@ -21,9 +116,7 @@ class FinancialCharts:
         if moving_averages is None:
             moving_averages = ['MA20', 'MA50', 'MA200']
         
-        if date_range:
-            start_date, end_date = date_range
-            df = df.loc[start_date:end_date]
+        df = _slice_by_date(df, date_range)
         
         rows = 2 if show_volume else 1
         row_heights = [0.7, 0.3] if show_volume else [1.0]
@@ -37,45 +130,116 @@ class FinancialCharts:
                           "Volume" if show_volume else None)
         )
         
-        fig.add_trace(
-            go.Candlestick(
-                x=df.index,
-                open=df['Open'],
-                high=df['High'],
-                low=df['Low'],
-                close=df['Close'],
-                name='Candlestick',
-                increasing_line_color='#26a69a',  # Green
-                decreasing_line_color='#ef553b',  # Red
-            ),
-            row=1, col=1
-        )
+        # go.Candlestick renders one SVG shape per bar; emulate it with
+        # Scattergl traces (high-low wicks + open-close bodies) so the whole
+        # series is a handful of WebGL draw calls.
+        open_arr = df['Open'].to_numpy(dtype=np.float64)
+        high_arr = df['High'].to_numpy(dtype=np.float64)
+        low_arr = df['Low'].to_numpy(dtype=np.float64)
+        close_arr = df['Close'].to_numpy(dtype=np.float64)
+        dates = df.index.to_numpy()
+        up = close_arr >= open_arr
+
+        # Columnar hover payload: one float32 OHLC row per candle instead
+        # of per-point formatted strings, halving the bytes of a float64
+        # encoding and leaving the formatting to the hover template.
+        ohlc = np.column_stack([open_arr, high_arr, low_arr, close_arr]).astype(np.float32)
+
+        # Group candles by direction first: each group's wicks and bodies
+        # become one trace each, so the renderer issues one draw per color
+        # group instead of restyling per bar.
+        for mask, color, label in (
+            (up, '#26a69a', 'Up'),        # Green
+            (~up, '#ef553b', 'Down'),     # Red
+        ):
+            group_dates = dates[mask]
+            wick_x, wick_y = _line_segments(group_dates, low_arr[mask], high_arr[mask])
+            fig.add_trace(
+                go.Scattergl(
+                    x=wick_x,
+                    y=wick_y,
+                    name=f'{label} wicks',
+                    mode='lines',
+                    line=dict(color=color, width=1),
+                    hoverinfo='skip',
+                    showlegend=False,
+                ),
+                row=1, col=1
+            )
+
+            body_x, body_y = _line_segments(group_dates, open_arr[mask], close_arr[mask])
+            fig.add_trace(
+                go.Scattergl(
+                    x=body_x,
+                    y=body_y,
+                    name=label,
+                    mode='lines',
+                    line=dict(color=color, width=5),
+                    # Repeat each OHLC row across the candle's three
+                    # interleaved points so customdata stays aligned.
+                    customdata=np.repeat(ohlc[mask], 3, axis=0),
+                    hovertemplate=(
+                        '%{x|%Y-%m-%d}<br>'
+                        'O:%{customdata[0]:.2f} H:%{customdata[1]:.2f} '
+                        'L:%{customdata[2]:.2f} C:%{customdata[3]:.2f}'
+                        '<extra></extra>'
+                    )
+                ),
+                row=1, col=1
+            )
 
         colors = ['#1f77b4', '#ff7f0e', '#2ca02c']  # Blue, Orange, Green
-        for i, ma_col in enumerate(moving_averages):
-            if ma_col in df.columns:
-                fig.add_trace(
-                    go.Scatter(
-                        x=df.index,
-                        y=df[ma_col],
-                        name=ma_col,
-                        mode='lines',
-                        line=dict(color=colors[i % len(colors)], width=2),
-                        hovertemplate='<b>%{fullData.name}</b><br>Date: %{x|%Y-%m-%d}<br>Price: $%{y:.2f}<extra></extra>'
-                    ),
-                    row=1, col=1
-                )
+        # One bulk add_traces call: the figure's internal state is rebuilt
+        # and validated once instead of per moving average.
+        ma_traces = [
+            go.Scattergl(
+                x=df.index.values,
+                y=_f32(df[ma_col]),
+                name=ma_col,
+                mode='lines',
+                line=dict(color=colors[i % len(colors)], width=2),
+                hovertemplate='<b>%{fullData.name}</b><br>Date: %{x|%Y-%m-%d}<br>Price: $%{y:.2f}<extra></extra>'
+            )
+            for i, ma_col in enumerate(moving_averages)
+            if ma_col in df.columns
+        ]
+        if ma_traces:
+            fig.add_traces(ma_traces, rows=[1] * len(ma_traces), cols=[1] * len(ma_traces))
 
         if show_volume:
-            colors_volume = ['#ef553b' if df['Close'].iloc[i] < df['Open'].iloc[i] else '#26a69a' 
-                           for i in range(len(df))]
-            
+            # The candle loop already classified every bar; an int8 code
+            # per bar (0=up, 1=down) plus a two-stop colorscale replaces
+            # the array of per-bar color strings.
+            colors_volume = (~up).astype(np.int8)
+
+            volume = df['Volume'].to_numpy()
+            volume_x = df.index
+            if volume.size > 1000:
+                # More bars than pixels: keep the max bar per ~500 buckets
+                # (at its true date) so spikes survive but the browser
+                # draws hundreds of rects instead of thousands.
+                n_bins = 500
+                edges = np.linspace(0, volume.size, n_bins + 1, dtype=int)
+                pos = np.array([
+                    edges[i] + int(np.argmax(volume[edges[i]:edges[i + 1]]))
+                    for i in range(n_bins)
+                ])
+                volume = volume[pos]
+                volume_x = volume_x[pos]
+                colors_volume = colors_volume[pos]
+
             fig.add_trace(
                 go.Bar(
-                    x=df.index,
-                    y=df['Volume'],
+                    x=volume_x,
+                    y=volume.astype(np.float32),
                     name='Volume',
-                    marker_color=colors_volume,
+                    marker=dict(
+                        color=colors_volume,
+                        colorscale=[[0, '#26a69a'], [1, '#ef553b']],
+                        cmin=0,
+                        cmax=1,
+                        showscale=False,
+                    ),
                     hovertemplate='<b>Volume</b><br>Date: %{x|%Y-%m-%d}<br>Volume: %{y:,.0f}<extra></extra>'
                 ),
                 row=2, col=1
@@ -89,12 +253,10 @@ class FinancialCharts:
         
         fig.update_layout(
             title=f"<b>{ticker} - Interactive Candlestick Chart</b>",
-            xaxis_rangeslider_visible=True,  
-            template="plotly_white",
+            xaxis_rangeslider_visible=True,
             height=700,
-            hovermode='x unified',
-            font=dict(size=11),
-            margin=dict(l=50, r=50, t=80, b=50)
+            margin=dict(l=50, r=50, t=80, b=50),
+            **_BASE_LAYOUT
         )
         
         return fig
@@ -106,16 +268,14 @@ class FinancialCharts:
         date_range: Tuple[str, str] = None
     ) -> go.Figure:
         
-        if date_range:
-            start_date, end_date = date_range
-            df = df.loc[start_date:end_date]
+        df = _slice_by_date(df, date_range)
         
         fig = go.Figure()
  
         fig.add_trace(
-            go.Scatter(
-                x=df.index,
-                y=df['Close'],
+            go.Scattergl(
+                x=df.index.values,
+                y=_f32(df['Close']),
                 name='Close Price',
                 mode='lines',
                 line=dict(color='#1f77b4', width=2),
@@ -126,9 +286,9 @@ class FinancialCharts:
 
         if 'Cum_Ret' in df.columns:
             fig.add_trace(
-                go.Scatter(
-                    x=df.index,
-                    y=df['Cum_Ret'] * 100,
+                go.Scattergl(
+                    x=df.index.values,
+                    y=_f32(df['Cum_Ret'] * 100),
                     name='Cumulative Return %',
                     mode='lines',
                     line=dict(color='#ff7f0e', width=2),
@@ -150,15 +310,13 @@ class FinancialCharts:
                 overlaying='y',
                 side='right'
             ),
-            template="plotly_white",
             height=500,
-            hovermode='x unified',
-            font=dict(size=11),
-            margin=dict(l=60, r=60, t=80, b=50)
+            margin=dict(l=60, r=60, t=80, b=50),
+            **_BASE_LAYOUT
         )
-        
-        return fig
-    
+
+        return _resample_figure(fig)
+
     @staticmethod
     def create_daily_returns_histogram(
         df: pd.DataFrame,
@@ -166,14 +324,23 @@ class FinancialCharts:
     ) -> go.Figure:
 
         
-        daily_ret = (df['Daily_Ret'] * 100).dropna()  
-        
+        # Filter and scale on the raw ndarray - no intermediate Series
+        # allocation or index alignment on the way to the histogram.
+        daily_ret = df['Daily_Ret'].to_numpy()
+        daily_ret = daily_ret[np.isfinite(daily_ret)] * 100
+
         fig = go.Figure()
-        
+
+        # Bin server-side: the browser receives 50 bars instead of every
+        # raw return plus the binning work go.Histogram does client-side.
+        counts, edges = np.histogram(daily_ret, bins=50)
+        centers = (edges[:-1] + edges[1:]) / 2
+
         fig.add_trace(
-            go.Histogram(
-                x=daily_ret,
-                nbinsx=50,
+            go.Bar(
+                x=centers,
+                y=counts,
+                width=edges[1] - edges[0],
                 name='Daily Returns',
                 marker_color='#1f77b4',
                 opacity=0.7,
@@ -194,7 +361,7 @@ class FinancialCharts:
             title=f"<b>{ticker} - Daily Returns Distribution</b>",
             xaxis_title="Daily Return (%)",
             yaxis_title="Frequency",
-            template="plotly_white",
+            template=_TEMPLATE,
             height=450,
             font=dict(size=11),
             margin=dict(l=50, r=50, t=80, b=50),
@@ -211,19 +378,18 @@ class FinancialCharts:
         date_range: Tuple[str, str] = None
     ) -> go.Figure:
 
-        if date_range:
-            start_date, end_date = date_range
-            df = df.loc[start_date:end_date]
+        df = _slice_by_date(df, date_range)
         
-        daily_ret = df['Close'].pct_change()
-        volatility = daily_ret.rolling(window=window).std() * 100
+        # njit-backed rolling std (same ddof=1 semantics as the old
+        # pct_change().rolling().std() pipeline, one pass, no temp Series).
+        volatility = FeatureEngineer.compute_volatility(df, window=window) * 100
         
         fig = go.Figure()
         
         fig.add_trace(
-            go.Scatter(
-                x=volatility.index,
-                y=volatility,
+            go.Scattergl(
+                x=volatility.index.values,
+                y=_f32(volatility),
                 name=f'{window}-Day Rolling Volatility',
                 mode='lines',
                 line=dict(color='#d62728', width=2),
@@ -236,14 +402,17 @@ class FinancialCharts:
             title=f"<b>{ticker} - {window}-Day Rolling Volatility</b>",
             xaxis_title="Date",
             yaxis_title="Daily Volatility (%)",
-            template="plotly_white",
             height=450,
-            hovermode='x unified',
-            font=dict(size=11),
-            margin=dict(l=50, r=50, t=80, b=50)
+            margin=dict(l=50, r=50, t=80, b=50),
+            **_BASE_LAYOUT
         )
-        
-        return fig
+
+        return _resample_figure(fig)
+
+
+# Above this many tickers the heatmap is rasterized server-side: one
+# RGBA image renders in O(pixels) instead of one shape per matrix cell.
+_HEATMAP_RASTER_THRESHOLD = 50
 
 
 class ComparativeCharts:
@@ -252,7 +421,10 @@ class ComparativeCharts:
         corr_matrix: pd.DataFrame,
         title: str = "Stock Correlation Matrix"
     ) -> go.Figure:
-        
+
+        if corr_matrix.shape[0] > _HEATMAP_RASTER_THRESHOLD:
+            return ComparativeCharts._create_correlation_raster(corr_matrix, title)
+
         fig = go.Figure(
             data=go.Heatmap(
                 z=corr_matrix.values,
@@ -271,7 +443,7 @@ class ComparativeCharts:
             title=f"<b>{title}</b>",
             xaxis_title="Stock Ticker",
             yaxis_title="Stock Ticker",
-            template="plotly_white",
+            template=_TEMPLATE,
             width=900,
             height=800,
             font=dict(size=10),
@@ -279,7 +451,39 @@ class ComparativeCharts:
         )
         
         return fig
-    
+
+    @staticmethod
+    def _create_correlation_raster(corr_matrix: pd.DataFrame, title: str) -> go.Figure:
+        # Large-N fallback: colormap the matrix server-side and ship one
+        # go.Image raster. The browser draws a single bitmap regardless of
+        # N, where go.Heatmap would emit N^2 individually-hoverable cells.
+        from matplotlib import colormaps
+
+        values = np.clip(corr_matrix.to_numpy(dtype=np.float64), -1.0, 1.0)
+        rgba = (colormaps['RdBu_r']((values + 1.0) / 2.0) * 255).astype(np.uint8)
+
+        n = values.shape[0]
+        # Thin the axis labels so they stay legible at large N.
+        step = max(1, n // 25)
+        ticks = np.arange(0, n, step)
+
+        fig = go.Figure(go.Image(z=rgba, hoverinfo='skip'))
+        fig.update_xaxes(tickvals=ticks, ticktext=corr_matrix.columns[ticks])
+        fig.update_yaxes(tickvals=ticks, ticktext=corr_matrix.index[ticks])
+
+        fig.update_layout(
+            title=f"<b>{title}</b>",
+            xaxis_title="Stock Ticker",
+            yaxis_title="Stock Ticker",
+            template=_TEMPLATE,
+            width=900,
+            height=800,
+            font=dict(size=10),
+            margin=dict(l=100, r=50, t=80, b=100)
+        )
+
+        return fig
+
     @staticmethod
     def create_risk_return_scatter(
         risk_return_df: pd.DataFrame,
@@ -315,7 +519,7 @@ class ComparativeCharts:
             title=f"<b>{title}</b>",
             xaxis_title="Risk (Daily Volatility %)",
             yaxis_title="Annual Return (%)",
-            template="plotly_white",
+            template=_TEMPLATE,
             width=900,
             height=600,
             hovermode='closest',
@@ -336,20 +540,19 @@ class ComparativeCharts:
         colors = px.colors.qualitative.Set2
         
         for i, (ticker, df) in enumerate(stock_data_dict.items()):
-            if date_range:
-                start_date, end_date = date_range
-                df = df.loc[start_date:end_date]
-            
-            # Compute cumulative returns if not present
-            if 'Cum_Ret' not in df.columns:
-                df = df.copy()
-                daily_ret = df['Close'].pct_change()
-                df['Cum_Ret'] = (1 + daily_ret).cumprod() - 1
-            
+            # Slice first so any fallback computation only touches the
+            # visible window.
+            df = _slice_by_date(df, date_range)
+
+            if 'Cum_Ret' in df.columns:
+                cum_ret = df['Cum_Ret'].to_numpy()
+            else:
+                cum_ret = _cum_ret(df['Close'].to_numpy(dtype=np.float64))
+
             fig.add_trace(
-                go.Scatter(
-                    x=df.index,
-                    y=df['Cum_Ret'] * 100,  # Convert to percentage
+                go.Scattergl(
+                    x=df.index.values,
+                    y=(cum_ret * 100).astype(np.float32),  # Convert to percentage
                     name=ticker,
                     mode='lines',
                     line=dict(color=colors[i % len(colors)], width=2),
@@ -361,14 +564,12 @@ class ComparativeCharts:
             title="<b>Multi-Stock Cumulative Returns Comparison</b>",
             xaxis_title="Date",
             yaxis_title="Cumulative Return (%)",
-            template="plotly_white",
             height=550,
-            hovermode='x unified',
-            font=dict(size=11),
-            margin=dict(l=60, r=50, t=80, b=50)
+            margin=dict(l=60, r=50, t=80, b=50),
+            **_BASE_LAYOUT
         )
-        
-        return fig
+
+        return _resample_figure(fig)
 
 
 if __name__ == "__main__":